@@ -1,122 +1,48 @@
 """
-Setup script for user data storage system.
-This file initializes the database and provides functions to interact with user data.
-Modified to properly work with web browsers and server-side storage.
+User accounts, profiles and matching.
+Registers the login, registration, profile and match routes as a blueprint on the
+shared application from backend/app.py.
 """
-import os
-import json
-from flask import Flask, request, jsonify, session
-from flask_sqlalchemy import SQLAlchemy
-from flask_cors import CORS  # For handling cross-origin requests
+from flask import Blueprint, request, jsonify, session
 from werkzeug.security import generate_password_hash, check_password_hash
-from dotenv import load_dotenv
 from sqlalchemy import func, or_
 
-# Load environment variables
-load_dotenv()
+from backend.limits import rate_limit, shed_load
+from backend.models import db, User, Profile, Profession, ProfileProfessions
 
-# Create a minimal Flask app
-app = Flask(__name__)
-
-# Enable CORS to allow browser requests from different origins
-CORS(app, supports_credentials=True)
-
-# Configure the SQLAlchemy database
-
-# Use Heroku DATABASE_URL if present, otherwise fall back to local SQLite
-db_url = os.environ.get('DATABASE_URL', 'sqlite:///users.db')
-# SQLAlchemy expects the postgresql:// scheme
-if db_url.startswith('postgres://'):
-    db_url = db_url.replace('postgres://', 'postgresql://', 1)
-
-# Ensure we handle Heroku's PostgreSQL URL format correctly
-db_url = os.environ.get('DATABASE_URL', 'sqlite:///users.db')
-# Fix for Heroku PostgreSQL URL format
-if db_url.startswith('postgres://'):
-    db_url = db_url.replace('postgres://', 'postgresql://', 1)
-
-
-app.config['SQLALCHEMY_DATABASE_URI'] = db_url
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-
-# Set secret key for sessions
-app.secret_key = os.environ.get('SECRET_KEY', 'dev-secret-key')  # Change in production!
-
-# Initialize SQLAlchemy
-db = SQLAlchemy(app)
-
-# Define models
-class User(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    email = db.Column(db.String, unique=True, nullable=False)
-    password_hash = db.Column(db.String, nullable=False)
-    role = db.Column(db.String, nullable=False)  # 'client' or 'pro'
-
-    profile = db.relationship('Profile', uselist=False, backref='user')
-
-    # One-to-one relationship: each user has one profile
-    profile = db.relationship('Profile', uselist=False, backref='user', cascade='all, delete-orphan')
-
-
-class Profile(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    name = db.Column(db.String, nullable=False)
-    bio = db.Column(db.Text)
-    location = db.Column(db.String)
-    lat = db.Column(db.Float)
-    lng = db.Column(db.Float)
-    is_available = db.Column(db.Boolean, default=True)
-    is_advertiser = db.Column(db.Boolean, default=False)
-    professions = db.relationship(
-        'Profession', secondary='profile_professions', backref='profiles'
-    )
-
-class Profession(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String, unique=True, nullable=False)
-
-class ProfileProfessions(db.Model):
-    __tablename__ = 'profile_professions'
-    profile_id = db.Column(db.Integer, db.ForeignKey('profile.id'), primary_key=True)
-    profession_id = db.Column(db.Integer, db.ForeignKey('profession.id'), primary_key=True)
+users_bp = Blueprint('users', __name__)
 
 # User data management functions
-def initialize_database():
-    """Create all database tables"""
-    with app.app_context():
-        db.create_all()
-        print("Database initialized successfully.")
+# (tables are created by backend/release.py)
 
 # ... other helper functions (add_user, get_user, etc.) ...
 
 def add_user(email, password, name, role, is_advertiser=False, professions=None,
              bio='', location='', lat=None, lng=None):
-    with app.app_context():
-        user = User(
-            email=email,
-            password_hash=generate_password_hash(password),
-            role=role
-        )
-        profile = Profile(
-            name=name,
-            bio=bio,
-            location=location,
-            lat=lat,
-            lng=lng,
-            is_advertiser=is_advertiser
-        )
-        user.profile = profile
-        if professions:
-            for prof_name in professions:
-                profession = Profession.query.filter_by(name=prof_name).first()
-                if not profession:
-                    profession = Profession(name=prof_name)
-                    db.session.add(profession)
-                profile.professions.append(profession)
-        db.session.add(user)
-        db.session.commit()
-        return user.id
+    user = User(
+        email=email,
+        password_hash=generate_password_hash(password),
+        role=role
+    )
+    profile = Profile(
+        name=name,
+        bio=bio,
+        location=location,
+        lat=lat,
+        lng=lng,
+        is_advertiser=is_advertiser
+    )
+    user.profile = profile
+    if professions:
+        for prof_name in professions:
+            profession = Profession.query.filter_by(name=prof_name).first()
+            if not profession:
+                profession = Profession(name=prof_name)
+                db.session.add(profession)
+            profile.professions.append(profession)
+    db.session.add(user)
+    db.session.commit()
+    return user.id
 
 # ... other CRUD functions ...
 
@@ -131,8 +57,7 @@ def get_user_by_email(email):
     Returns:
         User: User object or None
     """
-    with app.app_context():
-        return User.query.filter_by(email=email).first()
+    return User.query.filter_by(email=email).first()
 
 def find_users_by_profession(profession_name, advertiser_only=False):
     """
@@ -145,28 +70,27 @@ def find_users_by_profession(profession_name, advertiser_only=False):
     Returns:
         list: List of user profiles matching the criteria
     """
-    with app.app_context():
-        query = Profile.query.join(Profile.professions).filter(Profession.name == profession_name)
-        
+    query = Profile.query.join(Profile.professions).filter(Profession.name == profession_name)
+    
+    if advertiser_only:
+        query = query.filter(Profile.is_available == True)
         if advertiser_only:
-            query = query.filter(Profile.is_available == True)
-            if advertiser_only:
-                query = query.filter(Profile.is_advertiser == True)
-        
-        profiles = query.all()
+            query = query.filter(Profile.is_advertiser == True)
+    
+    profiles = query.all()
+    
+    result = []
+    for profile in profiles:
+        result.append({
+            "user_id": profile.user_id,
+            "name": profile.name,
+            "location": profile.location,
+            "lat": profile.lat,
+            "lng": profile.lng,
+            "is_advertiser": profile.is_advertiser
+        })
         
-        result = []
-        for profile in profiles:
-            result.append({
-                "user_id": profile.user_id,
-                "name": profile.name,
-                "location": profile.location,
-                "lat": profile.lat,
-                "lng": profile.lng,
-                "is_advertiser": profile.is_advertiser
-            })
-            
-        return result
+    return result
 
 def find_matching_professionals(needed_services, location=None, distance=50):
     """
@@ -180,38 +104,37 @@ def find_matching_professionals(needed_services, location=None, distance=50):
     Returns:
         list: List of matching professionals
     """
-    with app.app_context():
-        # Start with professionals who are available
-        query = db.session.query(User, Profile).join(Profile).filter(
-            User.role == 'pro',
-            Profile.is_available == True,
-            Profile.is_advertiser == True
+    # Start with professionals who are available
+    query = db.session.query(User, Profile).join(Profile).filter(
+        User.role == 'pro',
+        Profile.is_available == True,
+        Profile.is_advertiser == True
+    )
+    
+    # Filter by matching professions if services specified
+    if needed_services:
+        query = query.join(Profile.professions).filter(
+            Profession.name.in_(needed_services)
+        ).group_by(User.id, Profile.id).having(
+            func.count(Profession.id) > 0  # At least one matching profession
         )
-        
-        # Filter by matching professions if services specified
-        if needed_services:
-            query = query.join(Profile.professions).filter(
-                Profession.name.in_(needed_services)
-            ).group_by(User.id, Profile.id).having(
-                func.count(Profession.id) > 0  # At least one matching profession
-            )
-        
-        # Filter by location if specified
-        if location:
-            query = query.filter(Profile.location.ilike(f"%{location}%"))
-        
-        # Execute query and format results
-        results = []
-        for user, profile in query.all():
-            results.append({
-                'id': user.id,
-                'name': profile.name,
-                'location': profile.location,
-                'bio': profile.bio,
-                'professions': [p.name for p in profile.professions]
-            })
-        
-        return results
+    
+    # Filter by location if specified
+    if location:
+        query = query.filter(Profile.location.ilike(f"%{location}%"))
+    
+    # Execute query and format results
+    results = []
+    for user, profile in query.all():
+        results.append({
+            'id': user.id,
+            'name': profile.name,
+            'location': profile.location,
+            'bio': profile.bio,
+            'professions': [p.name for p in profile.professions]
+        })
+    
+    return results
 
 def update_user(user_id, data):
     """
@@ -225,18 +148,12 @@ def update_user(user_id, data):
         bool: True if successful
     """
 
-    with app.app_context():
-        user = User.query.get(user_id)
-        if not user:
-            return False
-        db.session.delete(user)
-        db.session.commit()
-        return True
-
-
-# Allow the script to be run directly to initialize the database
-if __name__ == '__main__':
-    initialize_database()
+    user = User.query.get(user_id)
+    if not user:
+        return False
+    db.session.delete(user)
+    db.session.commit()
+    return True
 
 def delete_user(user_id):
     """
@@ -248,17 +165,16 @@ def delete_user(user_id):
     Returns:
         bool: True if successful
     """
-    with app.app_context():
-        user = User.query.get(user_id)
-        if not user:
-            return False
-        
-        db.session.delete(user)
-        db.session.commit()
-        return True
+    user = User.query.get(user_id)
+    if not user:
+        return False
+    
+    db.session.delete(user)
+    db.session.commit()
+    return True
 
 # Web routes for browser integration
-@app.route('/api/login', methods=['POST'])
+@users_bp.route('/api/login', methods=['POST'])
 def login():
     """User login endpoint"""
     try:
@@ -297,13 +213,15 @@ def login():
         print(f"Login error: {e}")
         return jsonify({'error': 'Server error'}), 500
 
-@app.route('/api/logout', methods=['POST'])
+@users_bp.route('/api/logout', methods=['POST'])
 def logout():
     """User logout endpoint"""
     session.clear()
     return jsonify({'success': True})
 
-@app.route('/api/register', methods=['POST'])
+@users_bp.route('/api/register', methods=['POST'])
+@rate_limit(rate=0.1, burst=5)
+@shed_load
 def register():
     """User registration endpoint"""
     try:
@@ -333,7 +251,7 @@ def register():
         print(f"Registration error: {e}")
         return jsonify({'error': 'Server error'}), 500
 
-@app.route('/api/user/profile', methods=['GET'])
+@users_bp.route('/api/user/profile', methods=['GET'])
 def get_user_profile():
     """Get the current user's profile"""
     if 'user_id' not in session:
@@ -345,7 +263,7 @@ def get_user_profile():
     
     return jsonify(user_data)
 
-@app.route('/api/user/profile', methods=['PUT'])
+@users_bp.route('/api/user/profile', methods=['PUT'])
 def update_user_profile():
     """Update the current user's profile"""
     if 'user_id' not in session:
@@ -359,7 +277,7 @@ def update_user_profile():
     
     return jsonify({'success': True})
 
-@app.route('/api/match', methods=['GET'])
+@users_bp.route('/api/match', methods=['GET'])
 def find_matches():
     """Find matching users based on profession/services"""
     professions = request.args.getlist('professions[]')
@@ -367,19 +285,3 @@ def find_matches():
     
     results = find_matching_professionals(professions, location)
     return jsonify(results)
-
-# If this file is run directly, initialize the database
-if __name__ == '__main__':
-    # Check if running on Heroku
-    if 'PORT' in os.environ:
-        # Running on Heroku
-        port = int(os.environ.get('PORT', 5000))
-        # Initialize database
-        initialize_database()
-        # Run app
-        app.run(host='0.0.0.0', port=port)
-    else:
-        # Local development
-        initialize_database()
-        app.run(debug=True)
-
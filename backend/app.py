@@ -1,102 +1,51 @@
 import os
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask
 from flask_cors import CORS
-from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
-from math import radians, sin, cos, sqrt, atan2
-
-# Initialize Flask with static folder pointing to React's build output
-global_app = Flask(
-    __name__,
-    static_folder=os.path.join(os.path.dirname(__file__), '../frontend/build'),
-    static_url_path='/'
-)
-app = global_app
-CORS(app)
-
-# Database Configuration
-# Use Heroku DATABASE_URL if present, otherwise fall back to local SQLite
-db_url = os.environ.get('DATABASE_URL', 'sqlite:///app.db')
-# SQLAlchemy requires postgresql:// scheme instead of postgres://
-if db_url.startswith("postgres://"):
-    db_url = db_url.replace("postgres://", "postgresql://", 1)
-
-global_app.config['SQLALCHEMY_DATABASE_URI'] = db_url
-global_app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-
-db = SQLAlchemy(global_app)
-
-# Database Model
-class Professional(db.Model):
-    id = db.Column(db.Integer, primary_key=True)
-    name = db.Column(db.String(100), nullable=False)
-    profession = db.Column(db.String(100), nullable=False)
-    lat = db.Column(db.Float, nullable=False)
-    lng = db.Column(db.Float, nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-
-# Utility function to compute distance
-def haversine(lat1, lon1, lat2, lon2):
-    R = 6371  # Earth radius in km
-    φ1, φ2 = radians(lat1), radians(lat2)
-    Δφ = radians(lat2 - lat1)
-    Δλ = radians(lon2 - lon1)
-    a = sin(Δφ/2)**2 + cos(φ1) * cos(φ2) * sin(Δλ/2)**2
-    c = 2 * atan2(sqrt(a), sqrt(1 - a))
-    return R * c
-
-# --- API ROUTES ---
-@app.route("/api/greet")
-def greet():
-    return jsonify(message="Hello from Flask!")
-
-@app.route("/api/professionals", methods=["POST"])
-def register_professional():
-    data = request.get_json()
-    prof = Professional(
-        name=data["name"],
-        profession=data["profession"],
-        lat=data["lat"],
-        lng=data["lng"]
-    )
-    db.session.add(prof)
-    db.session.commit()
-    return jsonify(id=prof.id), 201
-
-@app.route("/api/search", methods=["POST"])
-def search_professionals():
-    data = request.get_json()
-    target_prof = data["profession"]
-    user_lat, user_lng = data["lat"], data["lng"]
-
-    matches = []
-    pros = Professional.query.filter_by(profession=target_prof).all()
-    for p in pros:
-        dist = round(haversine(user_lat, user_lng, p.lat, p.lng), 2)
-        matches.append({
-            "id": p.id,
-            "name": p.name,
-            "profession": p.profession,
-            "distance_km": dist,
-            "created_at": p.created_at.strftime('%Y-%m-%d %H:%M:%S')
-        })
-    matches.sort(key=lambda x: x["distance_km"])
-    return jsonify(matches)
-
-# --- REACT FRONTEND ROUTES ---
-@app.route('/', defaults={'path': ''})
-@app.route('/<path:path>')
-def serve_react(path):
-    build_dir = app.static_folder
-    file_path = os.path.join(build_dir, path)
-    if path and os.path.exists(file_path):
-        return send_from_directory(build_dir, path)
-    return send_from_directory(build_dir, 'index.html')
-
-if __name__ == "__main__":
-    port = int(os.environ.get("PORT", 5000))
-    # Create tables if running locally
-    if db_url.startswith('sqlite'):
-        with global_app.app_context():
-            db.create_all()
-    app.run(host='0.0.0.0', port=port)
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+from backend.config import Config
+from backend.models import db, migrate
+from backend.search import search_bp
+from backend.Database import users_bp
+from backend.frontend import init_frontend
+from backend.limits import init_limits
+
+# React's build output, served by the catch-all route below
+BUILD_DIR = os.path.join(os.path.dirname(__file__), '../frontend/build')
+# Local SQLite databases live in backend/instance
+INSTANCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'instance')
+
+def create_app(config=Config):
+    """
+    Application factory
+
+    Builds the single Flask app served by gunicorn. All blueprints share one
+    SQLAlchemy engine, so each worker opens exactly one connection pool.
+
+    Args:
+        config (object): Configuration object loaded with app.config.from_object
+
+    Returns:
+        Flask: The configured application
+    """
+    # The React build is served by backend/frontend.py, not Flask's static route
+    app = Flask(__name__, static_folder=None, instance_path=INSTANCE_DIR)
+    app.config.from_object(config)
+    # Only trust X-Forwarded-For from the configured number of proxies
+    if app.config['PROXY_FIX_X_FOR']:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['PROXY_FIX_X_FOR'])
+
+    # Enable CORS to allow browser requests (with session cookies) from different origins
+    CORS(app, supports_credentials=True)
+    db.init_app(app)
+    migrate.init_app(app, db)
+    init_limits(app)
+
+    app.register_blueprint(search_bp)
+    app.register_blueprint(users_bp)
+
+    init_frontend(app, BUILD_DIR)
+
+    return app
+
+app = create_app()
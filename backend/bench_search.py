@@ -0,0 +1,100 @@
+"""
+Load benchmark for /api/search.
+Start the server in each mode and point this script at it:
+
+    RATE_LIMIT_ENABLED=0 WORKER_MODE=sync  gunicorn backend.app:app
+    RATE_LIMIT_ENABLED=0 WORKER_MODE=async gunicorn backend.app:app
+    python -m backend.bench_search --url http://localhost:5000 --concurrency 200
+
+RATE_LIMIT_ENABLED=0 turns off the per-client limits and admission control in
+backend/limits.py, which would otherwise reject most of the traffic from one IP.
+It seeds a few professionals through /api/professionals, then fires searches from
+many client threads and reports throughput, latency percentiles and non-2xx responses.
+"""
+import argparse
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+PROFESSIONS = ['doctor', 'welder', 'plumber', 'electrician']
+
+def post(url, payload):
+    """POST JSON and return the HTTP status code"""
+    req = Request(url, data=json.dumps(payload).encode(), headers={'Content-Type': 'application/json'})
+    try:
+        with urlopen(req, timeout=60) as res:
+            res.read()
+            return res.status
+    except HTTPError as e:
+        return e.code
+
+def seed(base_url, count):
+    """Insert professionals; returns how many were rejected"""
+    failed = 0
+    for i in range(count):
+        status = post(f'{base_url}/api/professionals', {
+            'name': f'bench-{i}',
+            'profession': random.choice(PROFESSIONS),
+            'lat': random.uniform(-38.0, -37.6),
+            'lng': random.uniform(144.7, 145.2),
+        })
+        failed += not 200 <= status < 300
+    return failed
+
+def timed_search(base_url):
+    """Run one search; returns (latency in seconds, HTTP status)"""
+    start = time.perf_counter()
+    status = post(f'{base_url}/api/search', {
+        'profession': random.choice(PROFESSIONS),
+        'lat': random.uniform(-38.0, -37.6),
+        'lng': random.uniform(144.7, 145.2),
+    })
+    return time.perf_counter() - start, status
+
+def run(base_url, requests, concurrency):
+    """
+    Fire searches concurrently
+
+    Args:
+        base_url (str): Server root, e.g. http://localhost:5000
+        requests (int): Total number of searches
+        concurrency (int): Number of client threads
+
+    Returns:
+        dict: Throughput, latency percentiles in milliseconds and non-2xx count
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(lambda _: timed_search(base_url), range(requests)))
+    elapsed = time.perf_counter() - start
+    latencies = sorted(latency for latency, _ in outcomes)
+
+    def percentile(p):
+        return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000, 1)
+
+    return {
+        'requests': requests,
+        'concurrency': concurrency,
+        'requests_per_sec': round(requests / elapsed, 1),
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+        'non_2xx': sum(not 200 <= status < 300 for _, status in outcomes),
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://localhost:5000')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0, help='professionals to insert before the run')
+    args = parser.parse_args()
+
+    if args.seed:
+        rejected = seed(args.url, args.seed)
+        if rejected:
+            print(f'{rejected} of {args.seed} seed inserts were rejected (is RATE_LIMIT_ENABLED=0 set?)')
+    print(json.dumps(run(args.url, args.requests, args.concurrency), indent=2))
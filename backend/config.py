@@ -0,0 +1,119 @@
+"""
+Configuration for the Flask application factory.
+Everything is read from the environment so Heroku and local runs share one code path.
+"""
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+def database_url():
+    """
+    Resolve the database URL
+
+    Returns:
+        str: Heroku DATABASE_URL if present, otherwise local SQLite
+    """
+    db_url = os.environ.get('DATABASE_URL', 'sqlite:///app.db')
+    # SQLAlchemy requires postgresql:// scheme instead of postgres://
+    if db_url.startswith('postgres://'):
+        db_url = db_url.replace('postgres://', 'postgresql://', 1)
+    return db_url
+
+def gunicorn_workers():
+    """Number of gunicorn worker processes (Heroku sets WEB_CONCURRENCY)"""
+    return max(1, int(os.environ.get('WEB_CONCURRENCY', 2)))
+
+def worker_mode():
+    """
+    Gunicorn serving mode (WORKER_MODE)
+
+    'sync' serves one request at a time per worker. 'async' runs gevent
+    workers, where each request is a greenlet and psycopg2 yields while it
+    waits on Postgres, so one worker multiplexes many concurrent searches.
+    """
+    mode = os.environ.get('WORKER_MODE', 'sync')
+    if mode not in ('sync', 'async'):
+        raise ValueError(f"WORKER_MODE must be 'sync' or 'async', got {mode!r}")
+    return mode
+
+def worker_connections():
+    """Concurrent requests one gevent worker accepts (WORKER_CONNECTIONS)"""
+    return max(1, int(os.environ.get('WORKER_CONNECTIONS', 500)))
+
+def db_pool_size():
+    """Per-worker pool size: DB_POOL_SIZE, else DB_MAX_CONNECTIONS split across workers"""
+    max_connections = int(os.environ.get('DB_MAX_CONNECTIONS', 20))
+    return int(os.environ.get('DB_POOL_SIZE', max(1, max_connections // gunicorn_workers())))
+
+def route_concurrency(share):
+    """
+    Default in-flight cap for one route within a worker
+
+    An async worker runs up to WORKER_CONNECTIONS requests at once; a route
+    gets that share of them (never fewer than the pool size), and shed_load
+    protects the pool beyond it. A sync worker runs one request at a time and
+    never reaches the cap.
+
+    Args:
+        share (float): Fraction of WORKER_CONNECTIONS the route may occupy
+
+    Returns:
+        int: Maximum concurrent requests
+    """
+    return max(db_pool_size(), int(worker_connections() * share))
+
+def engine_options(db_url):
+    """
+    Build SQLALCHEMY_ENGINE_OPTIONS for the shared engine
+
+    Every gunicorn worker owns its own pool, so the connection budget
+    (DB_MAX_CONNECTIONS) is split across WEB_CONCURRENCY workers. File-based
+    SQLite uses the same QueuePool, so it gets the same sizing and timeout.
+
+    Args:
+        db_url (str): Database URL the engine will connect to
+
+    Returns:
+        dict: Keyword arguments passed to sqlalchemy.create_engine
+    """
+    options = {
+        # Drop connections the server closed while idle instead of failing a request
+        'pool_pre_ping': True,
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+    }
+    # In-memory SQLite gets a single shared connection (StaticPool) that takes no sizing
+    if db_url == 'sqlite://' or ':memory:' in db_url or 'mode=memory' in db_url:
+        return options
+
+    options.update({
+        'pool_size': db_pool_size(),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 0)),
+        'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+    })
+    return options
+
+class Config:
+    SQLALCHEMY_DATABASE_URI = database_url()
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+    # Set secret key for sessions
+    SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key')  # Change in production!
+
+    # Admission control for the public endpoints (see backend/limits.py);
+    # 0 disables rate limits, concurrency caps and load shedding together
+    RATE_LIMIT_ENABLED = os.environ.get('RATE_LIMIT_ENABLED', '1') == '1'
+    # 'memory' keeps buckets per worker; 'redis' shares them across workers and dynos
+    RATE_LIMIT_BACKEND = os.environ.get('RATE_LIMIT_BACKEND', 'memory')
+    # An empty REDIS_URL (as in .env.example) falls back to a local Redis
+    REDIS_URL = os.environ.get('REDIS_URL') or 'redis://localhost:6379/0'
+    # Requests allowed to wait on an exhausted DB pool before new ones are shed
+    DB_QUEUE_THRESHOLD = int(os.environ.get('DB_QUEUE_THRESHOLD', 4))
+    # Per-worker in-flight caps; they only bind under WORKER_MODE=async
+    SEARCH_CONCURRENCY = int(os.environ.get('SEARCH_CONCURRENCY', route_concurrency(1)))
+    BATCH_SEARCH_CONCURRENCY = int(os.environ.get('BATCH_SEARCH_CONCURRENCY', route_concurrency(0.05)))
+    DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', 10))
+    # Reverse proxies in front of gunicorn whose X-Forwarded-For entry is trusted
+    # (1 on Heroku); 0 keys clients on the socket address only
+    PROXY_FIX_X_FOR = int(os.environ.get('PROXY_FIX_X_FOR', 0))
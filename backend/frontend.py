@@ -0,0 +1,108 @@
+"""
+Static serving for the React build.
+The build directory is scanned once at startup so asset requests never touch the
+filesystem to decide what to send; the file itself goes out through send_file,
+which gunicorn streams with zero-copy sendfile via wsgi.file_wrapper.
+"""
+import os
+import re
+import mimetypes
+from flask import abort, request, send_file
+
+# CRA emits content-hashed bundles such as static/js/main.1a2b3c4d.js
+HASHED_ASSET = re.compile(r'\.[0-9a-f]{8,}\.')
+# Cache hashed assets for a year; their URL changes whenever their content does
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+# Unhashed files (favicon, manifest.json, ...) may change on the next deploy
+DEFAULT_MAX_AGE = 3600
+# Precompressed variants, in order of preference
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+class Asset:
+    def __init__(self, path, stat, hashed):
+        self.path = path
+        self.mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        self.etag = f'{stat.st_size:x}-{int(stat.st_mtime):x}'
+        self.last_modified = stat.st_mtime
+        self.hashed = hashed
+        # Content-Encoding -> path of the precompressed file
+        self.variants = {}
+
+def build_manifest(build_dir):
+    """
+    Scan the React build directory
+
+    Args:
+        build_dir (str): Path to frontend/build
+
+    Returns:
+        dict: URL path (relative to the build root) -> Asset
+    """
+    manifest = {}
+    compressed = []
+    for root, _, files in os.walk(build_dir):
+        for name in files:
+            full_path = os.path.join(root, name)
+            rel_path = os.path.relpath(full_path, build_dir).replace(os.sep, '/')
+            if name.endswith(('.br', '.gz')):
+                compressed.append(rel_path)
+                continue
+            manifest[rel_path] = Asset(full_path, os.stat(full_path), bool(HASHED_ASSET.search(name)))
+
+    for rel_path in compressed:
+        for encoding, suffix in ENCODINGS:
+            asset = manifest.get(rel_path[:-len(suffix)])
+            if rel_path.endswith(suffix) and asset:
+                asset.variants[encoding] = os.path.join(build_dir, rel_path)
+    return manifest
+
+def send_asset(asset):
+    """Send an Asset, choosing a precompressed variant the client accepts"""
+    path, encoding = asset.path, None
+    for name, _ in ENCODINGS:
+        # accept_encodings[name] is the quality; q=0 means the client refuses it
+        if name in asset.variants and request.accept_encodings[name] > 0:
+            path, encoding = asset.variants[name], name
+            break
+
+    etag = f'{asset.etag}-{encoding}' if encoding else asset.etag
+    response = send_file(path, mimetype=asset.mimetype, etag=etag,
+                         download_name=os.path.basename(asset.path),
+                         last_modified=asset.last_modified, conditional=True)
+
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    if asset.variants:
+        response.vary.add('Accept-Encoding')
+
+    response.cache_control.public = True
+    response.cache_control.no_cache = None
+    if asset.hashed:
+        response.cache_control.max_age = IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+    elif asset.path.endswith('.html'):
+        # index.html points at the current bundles, so always revalidate it
+        response.cache_control.no_cache = True
+    else:
+        response.cache_control.max_age = DEFAULT_MAX_AGE
+    return response
+
+def init_frontend(app, build_dir):
+    """
+    Register the React routes on the app
+
+    Args:
+        app (Flask): Application to register on
+        build_dir (str): Path to frontend/build
+    """
+    manifest = build_manifest(build_dir)
+    app.extensions['react_manifest'] = manifest
+
+    # --- REACT FRONTEND ROUTES ---
+    @app.route('/', defaults={'path': ''})
+    @app.route('/<path:path>')
+    def serve_react(path):
+        asset = manifest.get(path) or manifest.get('index.html')
+        if asset is None:
+            abort(404)
+        return send_asset(asset)
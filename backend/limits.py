@@ -0,0 +1,209 @@
+"""
+Rate limiting and admission control for the public endpoints.
+Three layers, applied as route decorators:
+- rate_limit: token bucket per client (session user, else client IP) -> 429
+- concurrency_limit: cap on in-flight requests per route per worker -> 503
+- shed_load: reject when the DB pool is exhausted and more than DB_QUEUE_THRESHOLD
+  requests are waiting for a connection -> 503
+Rejections carry a Retry-After header so well-behaved clients back off.
+RATE_LIMIT_ENABLED=0 turns all three off (e.g. for backend/bench_search.py).
+"""
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import current_app, jsonify, request, session
+
+from backend.models import db
+
+logger = logging.getLogger(__name__)
+
+class MemoryBackend:
+    """Token buckets in process memory; each gunicorn worker keeps its own"""
+
+    # Evict the least recently used buckets beyond this many clients
+    MAX_KEYS = 100000
+
+    def __init__(self):
+        self.buckets = OrderedDict()
+        self.lock = threading.Lock()
+
+    def take(self, key, rate, burst):
+        """
+        Take one token from a bucket
+
+        Args:
+            key (str): Bucket key
+            rate (float): Tokens refilled per second
+            burst (int): Bucket capacity
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until one is available
+        """
+        now = time.monotonic()
+        with self.lock:
+            tokens, last = self.buckets.pop(key, (burst, now))
+            tokens = min(burst, tokens + (now - last) * rate)
+            wait = 0 if tokens >= 1 else (1 - tokens) / rate
+            # Re-inserting keeps the dict ordered from least to most recently used
+            self.buckets[key] = (tokens - 1 if tokens >= 1 else tokens, now)
+            while len(self.buckets) > self.MAX_KEYS:
+                self.buckets.popitem(last=False)
+            return wait
+
+class RedisBackend:
+    """Token buckets shared by every worker and dyno through Redis"""
+
+    # Refill and take atomically on the server; returns seconds to wait (0 when allowed)
+    SCRIPT = """
+    local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens') or ARGV[2])
+    local last = tonumber(redis.call('HGET', KEYS[1], 'last') or ARGV[3])
+    local rate, burst, now = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+    tokens = math.min(burst, tokens + math.max(0, now - last) * rate)
+    local wait = 0
+    if tokens >= 1 then tokens = tokens - 1 else wait = (1 - tokens) / rate end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'last', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+    return tostring(wait)
+    """
+
+    def __init__(self, url):
+        # Optional dependency, only needed when RATE_LIMIT_BACKEND=redis
+        import redis
+        self.errors = redis.exceptions.RedisError
+        self.client = redis.Redis.from_url(url)
+        self.script = self.client.register_script(self.SCRIPT)
+        # Used while Redis is unreachable, so limits degrade to per-worker instead of failing requests
+        self.fallback = MemoryBackend()
+
+    def take(self, key, rate, burst):
+        try:
+            return float(self.script(keys=[f'ratelimit:{key}'], args=[rate, burst, time.time()]))
+        except self.errors as e:
+            logger.warning('Redis rate limit backend unavailable, using in-memory buckets: %s', e)
+            return self.fallback.take(key, rate, burst)
+
+class Counter:
+    """Thread-safe in-flight request count"""
+
+    def __init__(self):
+        self.value = 0
+        self.lock = threading.Lock()
+
+    def add(self, n):
+        with self.lock:
+            self.value += n
+            return self.value
+
+def init_limits(app):
+    """
+    Attach the rate limit backend selected by RATE_LIMIT_BACKEND
+
+    Args:
+        app (Flask): Application to configure
+    """
+    if app.config['RATE_LIMIT_BACKEND'] == 'redis':
+        backend = RedisBackend(app.config['REDIS_URL'])
+    else:
+        backend = MemoryBackend()
+    app.extensions['rate_limit_backend'] = backend
+    app.extensions['db_waiters'] = Counter()
+
+def client_key():
+    """Identify the caller: logged-in user, else client IP"""
+    if 'user_id' in session:
+        return f"user:{session['user_id']}"
+    # X-Forwarded-For is only honored through ProxyFix, for PROXY_FIX_X_FOR trusted hops
+    return f'ip:{request.remote_addr}'
+
+def too_many(message, status, retry_after):
+    response = jsonify({'error': message})
+    response.status_code = status
+    response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+    return response
+
+def rate_limit(rate, burst):
+    """
+    Token bucket limit per client for a route
+
+    Args:
+        rate (float): Requests per second refilled into the bucket
+        burst (int): Requests allowed back to back
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            if current_app.config['RATE_LIMIT_ENABLED']:
+                backend = current_app.extensions['rate_limit_backend']
+                wait = backend.take(f'{request.endpoint}:{client_key()}', rate, burst)
+                if wait:
+                    return too_many('Rate limit exceeded', 429, wait)
+            return view(*args, **kwargs)
+        return wrapped
+    return decorator
+
+def concurrency_limit(config_key):
+    """
+    Cap in-flight requests for a route within this worker
+
+    Args:
+        config_key (str): App config entry holding the maximum concurrent requests
+    """
+    def decorator(view):
+        in_flight = Counter()
+
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            if not current_app.config['RATE_LIMIT_ENABLED']:
+                return view(*args, **kwargs)
+            try:
+                if in_flight.add(1) > current_app.config[config_key]:
+                    return too_many('Server busy', 503, 1)
+                return view(*args, **kwargs)
+            finally:
+                in_flight.add(-1)
+        return wrapped
+    return decorator
+
+def pool_queue(in_flight):
+    """
+    Estimate how many requests are queued on this worker's DB pool
+
+    Args:
+        in_flight (int): Requests currently inside shed_load-protected views
+
+    Returns:
+        int: Requests without a connection while the pool is exhausted, else 0
+    """
+    pool = db.engine.pool
+    if not hasattr(pool, 'checkedout'):
+        return 0
+    checked_out = pool.checkedout()
+    capacity = pool.size() + max(0, pool._max_overflow)
+    if checked_out < capacity:
+        return 0
+    # Connections held outside protected views make this an underestimate, never an overestimate
+    return max(0, in_flight - checked_out)
+
+def shed_load(view):
+    """
+    Reject requests early when more than DB_QUEUE_THRESHOLD are waiting on the DB pool
+
+    A sync worker holds at most one connection, so this only triggers under
+    WORKER_MODE=async, where one worker runs many requests against its pool.
+    """
+    @wraps(view)
+    def wrapped(*args, **kwargs):
+        if not current_app.config['RATE_LIMIT_ENABLED']:
+            return view(*args, **kwargs)
+        waiters = current_app.extensions['db_waiters']
+        in_flight = waiters.add(1)
+        try:
+            if pool_queue(in_flight) > current_app.config['DB_QUEUE_THRESHOLD']:
+                return too_many('Server busy', 503, current_app.config['DB_POOL_TIMEOUT'])
+            return view(*args, **kwargs)
+        finally:
+            waiters.add(-1)
+    return wrapped
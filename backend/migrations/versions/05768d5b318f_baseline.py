@@ -0,0 +1,92 @@
+"""baseline schema
+
+Databases created before migrations existed were built with db.create_all(),
+so each table is only created when it is missing.
+
+Revision ID: 05768d5b318f
+Revises: 
+Create Date: 2026-10-19 14:10:48.671872
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '05768d5b318f'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'profession' not in existing:
+        op.create_table('profession',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name')
+        )
+    if 'professional' not in existing:
+        op.create_table('professional',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('profession', sa.String(length=100), nullable=False),
+        sa.Column('lat', sa.Float(), nullable=False),
+        sa.Column('lng', sa.Float(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+    if 'user' not in existing:
+        op.create_table('user',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('password_hash', sa.String(), nullable=False),
+        sa.Column('role', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('email')
+        )
+    if 'message' not in existing:
+        op.create_table('message',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('from_user_id', sa.Integer(), nullable=False),
+        sa.Column('to_user_id', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('timestamp', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(['from_user_id'], ['user.id'], ),
+        sa.ForeignKeyConstraint(['to_user_id'], ['user.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+    if 'profile' not in existing:
+        op.create_table('profile',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('bio', sa.Text(), nullable=True),
+        sa.Column('location', sa.String(), nullable=True),
+        sa.Column('lat', sa.Float(), nullable=True),
+        sa.Column('lng', sa.Float(), nullable=True),
+        sa.Column('is_available', sa.Boolean(), nullable=True),
+        sa.Column('is_advertiser', sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+    if 'profile_professions' not in existing:
+        op.create_table('profile_professions',
+        sa.Column('profile_id', sa.Integer(), nullable=False),
+        sa.Column('profession_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['profession_id'], ['profession.id'], ),
+        sa.ForeignKeyConstraint(['profile_id'], ['profile.id'], ),
+        sa.PrimaryKeyConstraint('profile_id', 'profession_id')
+        )
+
+
+def downgrade():
+    op.drop_table('profile_professions')
+    op.drop_table('profile')
+    op.drop_table('message')
+    op.drop_table('user')
+    op.drop_table('professional')
+    op.drop_table('profession')
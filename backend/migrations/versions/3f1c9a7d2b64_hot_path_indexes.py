@@ -0,0 +1,34 @@
+"""hot-path indexes for /api/search and /api/match
+
+Revision ID: 3f1c9a7d2b64
+Revises: 05768d5b318f
+Create Date: 2026-10-19 14:12:05.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c9a7d2b64'
+down_revision = '05768d5b318f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # /api/search filters on profession; lat/lng ride along for the distance pass
+    op.create_index('ix_professional_profession_lat_lng', 'professional', ['profession', 'lat', 'lng'], unique=False)
+    op.create_index('ix_user_role', 'user', ['role'], unique=False)
+    op.create_index('ix_profile_user_id', 'profile', ['user_id'], unique=False)
+    op.create_index('ix_profile_is_available_is_advertiser', 'profile', ['is_available', 'is_advertiser'], unique=False)
+    # Reverse lookup profession -> profiles; the primary key only serves profile -> professions
+    op.create_index('ix_profile_professions_profession_id_profile_id', 'profile_professions', ['profession_id', 'profile_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_profile_professions_profession_id_profile_id', table_name='profile_professions')
+    op.drop_index('ix_profile_is_available_is_advertiser', table_name='profile')
+    op.drop_index('ix_profile_user_id', table_name='profile')
+    op.drop_index('ix_user_role', table_name='user')
+    op.drop_index('ix_professional_profession_lat_lng', table_name='professional')
@@ -1,26 +1,51 @@
+import os
+from datetime import datetime
+
+from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 
 # Initialize the SQLAlchemy database handle
-# In your application factory or main file, make sure to call db.init_app(app)
+# The application factory in backend/app.py calls db.init_app(app), so every
+# blueprint shares one engine and one connection pool per process.
 db = SQLAlchemy()
+# Schema changes go through backend/migrations instead of db.create_all()
+migrate = Migrate(directory=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations'))
+
+class Professional(db.Model):
+    # /api/search filters on profession; lat/lng ride along for the distance pass
+    __table_args__ = (
+        db.Index('ix_professional_profession_lat_lng', 'profession', 'lat', 'lng'),
+    )
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    profession = db.Column(db.String(100), nullable=False)
+    lat = db.Column(db.Float, nullable=False)
+    lng = db.Column(db.Float, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String, unique=True, nullable=False)
     password_hash = db.Column(db.String, nullable=False)
-    role = db.Column(db.String, nullable=False)  # 'client' or 'pro'
+    role = db.Column(db.String, nullable=False, index=True)  # 'client' or 'pro'
     # One-to-one relationship: each user has one profile
-    profile = db.relationship('Profile', uselist=False, backref='user')
+    profile = db.relationship('Profile', uselist=False, backref='user', cascade='all, delete-orphan')
 
 class Profile(db.Model):
+    # /api/match filters on both flags together
+    __table_args__ = (
+        db.Index('ix_profile_is_available_is_advertiser', 'is_available', 'is_advertiser'),
+    )
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     name = db.Column(db.String, nullable=False)
     bio = db.Column(db.Text)
     location = db.Column(db.String)
-    lat = db.Column(db.Float, nullable=False)
-    lng = db.Column(db.Float, nullable=False)
+    # Registration allows a profile without coordinates
+    lat = db.Column(db.Float)
+    lng = db.Column(db.Float)
     is_available = db.Column(db.Boolean, default=True)
+    is_advertiser = db.Column(db.Boolean, default=False)
     # Many-to-many relationship: a profile can list multiple professions
     professions = db.relationship(
         'Profession',
@@ -34,6 +59,10 @@ class Profession(db.Model):
 
 class ProfileProfessions(db.Model):
     __tablename__ = 'profile_professions'
+    # The primary key serves profile -> professions; this serves profession -> profiles
+    __table_args__ = (
+        db.Index('ix_profile_professions_profession_id_profile_id', 'profession_id', 'profile_id'),
+    )
     profile_id = db.Column(
         db.Integer, db.ForeignKey('profile.id'), primary_key=True
     )
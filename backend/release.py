@@ -0,0 +1,22 @@
+"""
+Release step: bring the database schema up to date.
+Run as `python -m backend.release` (the Procfile release command).
+"""
+from flask_migrate import upgrade
+
+from backend.app import create_app
+
+def initialize_database(app=None):
+    """
+    Create or upgrade all database tables and indexes via backend/migrations
+
+    Args:
+        app (Flask): Application to migrate; a fresh one from create_app() if omitted
+    """
+    app = app or create_app()
+    with app.app_context():
+        upgrade()
+        print("Database initialized successfully.")
+
+if __name__ == '__main__':
+    initialize_database()
@@ -0,0 +1,178 @@
+import numpy as np
+from collections import defaultdict
+from flask import Blueprint, jsonify, request
+from math import radians, sin, cos, sqrt, atan2, isfinite
+
+from backend.limits import concurrency_limit, rate_limit, shed_load
+from backend.models import db, Professional
+
+search_bp = Blueprint('search', __name__)
+
+# Upper bounds for /api/search/batch
+MAX_BATCH_JOBS = 500
+MAX_BATCH_K = 50
+# Jobs per distance matrix, bounding memory at BATCH_CHUNK_ROWS x candidates
+BATCH_CHUNK_ROWS = 64
+
+# Utility function to compute distance
+def haversine(lat1, lon1, lat2, lon2):
+    R = 6371  # Earth radius in km
+    φ1, φ2 = radians(lat1), radians(lat2)
+    Δφ = radians(lat2 - lat1)
+    Δλ = radians(lon2 - lon1)
+    a = sin(Δφ/2)**2 + cos(φ1) * cos(φ2) * sin(Δλ/2)**2
+    c = 2 * atan2(sqrt(a), sqrt(1 - a))
+    return R * c
+
+def haversine_matrix(lats1, lngs1, lats2, lngs2):
+    """
+    Distances in km between every point of one set and every point of another
+
+    Args:
+        lats1, lngs1 (np.ndarray): Coordinates of the J origin points
+        lats2, lngs2 (np.ndarray): Coordinates of the C destination points
+
+    Returns:
+        np.ndarray: J x C matrix of distances
+    """
+    R = 6371  # Earth radius in km
+    φ1, φ2 = np.radians(lats1)[:, None], np.radians(lats2)[None, :]
+    Δφ = φ2 - φ1
+    Δλ = np.radians(lngs2)[None, :] - np.radians(lngs1)[:, None]
+    a = np.sin(Δφ/2)**2 + np.cos(φ1) * np.cos(φ2) * np.sin(Δλ/2)**2
+    return 2 * R * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+def parse_job(job):
+    """
+    Validate one batch job
+
+    Args:
+        job (dict): {"profession": str, "lat": number, "lng": number}
+
+    Returns:
+        tuple: (profession, lat, lng), or None if the job is invalid
+    """
+    if not isinstance(job, dict) or not isinstance(job.get("profession"), str):
+        return None
+    coords = []
+    for key, limit in (("lat", 90), ("lng", 180)):
+        value = job.get(key)
+        # bool is a subclass of int, and float() would turn true into 1.0
+        if value is None or isinstance(value, bool):
+            return None
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return None
+        # Rejects nan/inf too, which would otherwise serialize as invalid JSON
+        if not (isfinite(value) and -limit <= value <= limit):
+            return None
+        coords.append(value)
+    return (job["profession"], *coords)
+
+def serialize_match(p, dist):
+    return {
+        "id": p.id,
+        "name": p.name,
+        "profession": p.profession,
+        "distance_km": dist,
+        "created_at": p.created_at.strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+# --- API ROUTES ---
+@search_bp.route("/api/greet")
+def greet():
+    return jsonify(message="Hello from Flask!")
+
+@search_bp.route("/api/professionals", methods=["POST"])
+@rate_limit(rate=0.1, burst=5)
+@shed_load
+def register_professional():
+    data = request.get_json()
+    prof = Professional(
+        name=data["name"],
+        profession=data["profession"],
+        lat=data["lat"],
+        lng=data["lng"]
+    )
+    db.session.add(prof)
+    db.session.commit()
+    return jsonify(id=prof.id), 201
+
+@search_bp.route("/api/search", methods=["POST"])
+@rate_limit(rate=1, burst=20)
+@concurrency_limit('SEARCH_CONCURRENCY')
+@shed_load
+def search_professionals():
+    data = request.get_json()
+    target_prof = data["profession"]
+    user_lat, user_lng = data["lat"], data["lng"]
+
+    matches = []
+    pros = Professional.query.filter_by(profession=target_prof).all()
+    for p in pros:
+        dist = round(haversine(user_lat, user_lng, p.lat, p.lng), 2)
+        matches.append(serialize_match(p, dist))
+    matches.sort(key=lambda x: x["distance_km"])
+    return jsonify(matches)
+
+@search_bp.route("/api/search/batch", methods=["POST"])
+@rate_limit(rate=0.1, burst=5)
+@concurrency_limit('BATCH_SEARCH_CONCURRENCY')
+@shed_load
+def batch_search_professionals():
+    """
+    Resolve many (profession, lat, lng) jobs in one request
+
+    Body: {"jobs": [{"profession": str, "lat": float, "lng": float}, ...], "k": int}
+    Returns the k nearest professionals per job, in job order.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Body must be a JSON object'}), 400
+    jobs = data.get("jobs")
+    k = data.get("k", 5)
+    if not isinstance(jobs, list) or not jobs:
+        return jsonify({'error': 'jobs must be a non-empty list'}), 400
+    if len(jobs) > MAX_BATCH_JOBS:
+        return jsonify({'error': f'At most {MAX_BATCH_JOBS} jobs per request'}), 400
+    # bool is a subclass of int, so "k": true must be rejected explicitly
+    if not isinstance(k, int) or isinstance(k, bool) or not 1 <= k <= MAX_BATCH_K:
+        return jsonify({'error': f'k must be between 1 and {MAX_BATCH_K}'}), 400
+    jobs = [parse_job(job) for job in jobs]
+    if None in jobs:
+        return jsonify({'error': 'Each job needs a profession, lat in [-90, 90] and lng in [-180, 180]'}), 400
+
+    # Job indices grouped by profession
+    by_profession = defaultdict(list)
+    for i, (profession, _, _) in enumerate(jobs):
+        by_profession[profession].append(i)
+
+    # One scan loads the candidates for every profession in the batch
+    candidates = defaultdict(list)
+    for p in Professional.query.filter(Professional.profession.in_(list(by_profession))).all():
+        candidates[p.profession].append(p)
+
+    results = [[] for _ in jobs]
+    for profession, job_ids in by_profession.items():
+        pros = candidates[profession]
+        if not pros:
+            continue
+        pro_lats = np.array([p.lat for p in pros])
+        pro_lngs = np.array([p.lng for p in pros])
+        top = min(k, len(pros))
+        for start in range(0, len(job_ids), BATCH_CHUNK_ROWS):
+            chunk = job_ids[start:start + BATCH_CHUNK_ROWS]
+            dists = haversine_matrix(
+                np.array([jobs[i][1] for i in chunk]),
+                np.array([jobs[i][2] for i in chunk]),
+                pro_lats,
+                pro_lngs,
+            )
+            # Unordered k nearest per row, then sort just those k
+            nearest = np.argpartition(dists, top - 1, axis=1)[:, :top]
+            for row, i in enumerate(chunk):
+                order = nearest[row][np.argsort(dists[row, nearest[row]], kind='stable')]
+                results[i] = [serialize_match(pros[c], round(float(dists[row, c]), 2)) for c in order]
+
+    return jsonify(results=results)
@@ -0,0 +1,37 @@
+"""
+Gunicorn settings, picked up automatically from the working directory.
+"""
+import os
+
+from backend.config import database_url, gunicorn_workers, worker_mode
+from backend.config import worker_connections as connections_per_worker
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+# Same count backend/config.py divides the DB connection budget by
+workers = gunicorn_workers()
+
+if worker_mode() == 'async':
+    worker_class = 'gevent'
+    # Concurrent requests per worker; they queue on the DB pool beyond pool_size
+    worker_connections = connections_per_worker()
+    # gevent has to patch the stdlib before the app (and SQLAlchemy's pool locks) are imported
+    preload_app = False
+else:
+    # Import the app once in the master instead of once per worker
+    preload_app = True
+
+def post_fork(server, worker):
+    """Give each worker its own connection pool instead of the master's inherited sockets"""
+    if not preload_app:
+        return
+    from backend.app import app
+    from backend.models import db
+    with app.app_context():
+        db.engine.dispose(close=False)
+
+def post_worker_init(worker):
+    """Make psycopg2 yield to other greenlets while waiting on Postgres"""
+    # SQLite is local file I/O and is left blocking
+    if worker_mode() == 'async' and database_url().startswith('postgresql'):
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
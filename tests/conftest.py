@@ -0,0 +1,23 @@
+import pytest
+
+from backend.app import create_app
+from backend.config import Config
+from backend.models import db
+from backend.release import initialize_database
+
+@pytest.fixture
+def app(tmp_path):
+    """App on a fresh SQLite database migrated with backend/migrations"""
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'test.db'}"
+        RATE_LIMIT_ENABLED = False
+
+    app = create_app(TestConfig)
+    initialize_database(app)
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
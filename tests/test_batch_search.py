@@ -0,0 +1,101 @@
+import pytest
+
+import backend.search
+from backend.models import db, Professional
+from backend.search import MAX_BATCH_JOBS, MAX_BATCH_K
+
+@pytest.fixture
+def professionals(app):
+    rows = [
+        ('far', 'doctor', 0.0, 3.0),
+        ('near', 'doctor', 0.0, 1.0),
+        ('middle', 'doctor', 0.0, 2.0),
+        ('welder', 'welder', 0.0, 0.5),
+    ]
+    with app.app_context():
+        db.session.add_all(Professional(name=n, profession=p, lat=lat, lng=lng) for n, p, lat, lng in rows)
+        db.session.commit()
+
+def batch(client, jobs, **body):
+    return client.post('/api/search/batch', json={'jobs': jobs, **body})
+
+def names(matches):
+    return [m['name'] for m in matches]
+
+def test_top_k_nearest_in_order(client, professionals):
+    response = batch(client, [
+        {'profession': 'doctor', 'lat': 0, 'lng': 0},
+        {'profession': 'doctor', 'lat': 0, 'lng': 3.1},
+    ], k=2)
+    assert response.status_code == 200
+    first, second = response.json['results']
+    assert names(first) == ['near', 'middle']
+    assert names(second) == ['far', 'middle']
+    assert first[0]['distance_km'] < first[1]['distance_km']
+
+def test_k_larger_than_candidates_returns_all(client, professionals):
+    results = batch(client, [{'profession': 'doctor', 'lat': 0, 'lng': 0}], k=10).json['results']
+    assert names(results[0]) == ['near', 'middle', 'far']
+
+def test_profession_without_candidates_returns_empty(client, professionals):
+    results = batch(client, [
+        {'profession': 'plumber', 'lat': 0, 'lng': 0},
+        {'profession': 'welder', 'lat': 0, 'lng': 0},
+    ]).json['results']
+    assert results[0] == []
+    assert names(results[1]) == ['welder']
+
+def test_matches_single_search(client, professionals):
+    job = {'profession': 'doctor', 'lat': 0.2, 'lng': 1.7}
+    single = client.post('/api/search', json=job).json
+    assert batch(client, [job], k=3).json['results'][0] == single
+
+def test_chunked_rows_match_unchunked(client, professionals, monkeypatch):
+    jobs = [{'profession': 'doctor', 'lat': 0, 'lng': i * 0.5} for i in range(7)]
+    expected = batch(client, jobs, k=2).json['results']
+    monkeypatch.setattr(backend.search, 'BATCH_CHUNK_ROWS', 2)
+    assert batch(client, jobs, k=2).json['results'] == expected
+
+@pytest.mark.parametrize('body', [
+    {'jobs': []},
+    {'jobs': 'doctor'},
+    {'jobs': [{'profession': 'doctor', 'lat': 0, 'lng': 0}] * (MAX_BATCH_JOBS + 1)},
+    {'jobs': [{'profession': 'doctor', 'lat': 0, 'lng': 0}], 'k': 0},
+    {'jobs': [{'profession': 'doctor', 'lat': 0, 'lng': 0}], 'k': MAX_BATCH_K + 1},
+    {'jobs': [{'profession': 'doctor', 'lat': 0, 'lng': 0}], 'k': True},
+    {'jobs': [{'profession': 'doctor', 'lat': 0, 'lng': 0}], 'k': 2.5},
+    {'jobs': [{'profession': 'doctor', 'lat': 0}]},
+    {'jobs': [{'profession': 'doctor', 'lat': 'north', 'lng': 0}]},
+    {'jobs': [{'profession': 7, 'lat': 0, 'lng': 0}]},
+    {'jobs': ['doctor']},
+    [1, 2],
+    'jobs',
+    None,
+])
+def test_invalid_requests_are_rejected(client, body):
+    response = client.post('/api/search/batch', json=body)
+    assert response.status_code == 400
+    assert 'error' in response.json
+
+@pytest.mark.parametrize('lat, lng', [
+    ('nan', 0),
+    (0, 'nan'),
+    ('1e999', 0),
+    (0, '-inf'),
+    (True, 0),
+    (0, False),
+    (90.1, 0),
+    (-500, 0),
+    (0, 180.5),
+    (0, -181),
+])
+def test_invalid_coordinates_are_rejected(client, lat, lng):
+    response = batch(client, [{'profession': 'doctor', 'lat': lat, 'lng': lng}])
+    assert response.status_code == 400
+    assert 'error' in response.json
+
+@pytest.mark.parametrize('lat, lng', [(90, 180), (-90, -180), ('12.5', '-45')])
+def test_boundary_and_numeric_string_coordinates_are_accepted(client, professionals, lat, lng):
+    response = batch(client, [{'profession': 'doctor', 'lat': lat, 'lng': lng}], k=1)
+    assert response.status_code == 200
+    assert len(response.json['results'][0]) == 1
@@ -0,0 +1,17 @@
+from backend.config import engine_options, gunicorn_workers
+
+def test_file_sqlite_gets_configured_pool_sizing(monkeypatch):
+    monkeypatch.setenv('DB_MAX_CONNECTIONS', '20')
+    monkeypatch.setenv('WEB_CONCURRENCY', '4')
+    monkeypatch.setenv('DB_POOL_TIMEOUT', '7')
+    options = engine_options('sqlite:///app.db')
+    assert options['pool_size'] == 5
+    assert options['pool_timeout'] == 7
+
+def test_memory_sqlite_skips_pool_sizing():
+    for url in ('sqlite://', 'sqlite:///:memory:'):
+        assert 'pool_size' not in engine_options(url)
+
+def test_workers_never_zero(monkeypatch):
+    monkeypatch.setenv('WEB_CONCURRENCY', '0')
+    assert gunicorn_workers() == 1
@@ -0,0 +1,78 @@
+import gzip
+
+import pytest
+from flask import Flask
+
+from backend.frontend import IMMUTABLE_MAX_AGE, DEFAULT_MAX_AGE, build_manifest, init_frontend
+
+BUNDLE = 'static/js/main.1a2b3c4d.js'
+
+@pytest.fixture
+def build_dir(tmp_path):
+    (tmp_path / 'static' / 'js').mkdir(parents=True)
+    (tmp_path / 'index.html').write_text('<html></html>')
+    (tmp_path / 'manifest.json').write_text('{}')
+    bundle = tmp_path / BUNDLE
+    bundle.write_text('var a = 1;')
+    (tmp_path / f'{BUNDLE}.gz').write_bytes(gzip.compress(b'var a = 1;'))
+    (tmp_path / f'{BUNDLE}.br').write_bytes(b'brotli bytes')
+    return tmp_path
+
+@pytest.fixture
+def client(build_dir):
+    app = Flask(__name__, static_folder=None)
+    init_frontend(app, str(build_dir))
+    return app.test_client()
+
+def test_manifest_indexes_files_and_variants(build_dir):
+    manifest = build_manifest(str(build_dir))
+    assert set(manifest) == {'index.html', 'manifest.json', BUNDLE}
+    assert manifest[BUNDLE].hashed and not manifest['index.html'].hashed
+    assert set(manifest[BUNDLE].variants) == {'br', 'gzip'}
+
+@pytest.mark.parametrize('accept, expected', [
+    ('gzip, br', 'br'),
+    ('gzip', 'gzip'),
+    ('br;q=0, gzip', 'gzip'),
+    ('gzip;q=0, br;q=0', None),
+    ('', None),
+])
+def test_variant_follows_accept_encoding(client, accept, expected):
+    response = client.get(f'/{BUNDLE}', headers={'Accept-Encoding': accept})
+    assert response.status_code == 200
+    assert response.headers.get('Content-Encoding') == expected
+    assert 'Accept-Encoding' in response.headers['Vary']
+    if expected is None:
+        assert response.data == b'var a = 1;'
+
+def test_hashed_bundle_is_immutable(client):
+    cache = client.get(f'/{BUNDLE}').cache_control
+    assert cache.public and cache.immutable
+    assert cache.max_age == IMMUTABLE_MAX_AGE
+    assert not cache.no_cache
+
+def test_index_is_revalidated(client):
+    response = client.get('/')
+    assert response.cache_control.no_cache
+    assert response.cache_control.max_age is None
+    assert 'Vary' not in response.headers
+
+def test_unhashed_file_gets_short_cache(client):
+    assert client.get('/manifest.json').cache_control.max_age == DEFAULT_MAX_AGE
+
+def test_matching_etag_returns_304(client):
+    first = client.get(f'/{BUNDLE}', headers={'Accept-Encoding': 'gzip'})
+    again = client.get(f'/{BUNDLE}', headers={'Accept-Encoding': 'gzip', 'If-None-Match': first.headers['ETag']})
+    assert again.status_code == 304
+    # The identity and gzip bodies differ, so they must not share an ETag
+    assert client.get(f'/{BUNDLE}').headers['ETag'] != first.headers['ETag']
+
+def test_unknown_path_falls_back_to_index(client):
+    response = client.get('/jobs/42')
+    assert response.status_code == 200
+    assert response.data == b'<html></html>'
+
+def test_missing_build_returns_404(tmp_path):
+    app = Flask(__name__, static_folder=None)
+    init_frontend(app, str(tmp_path / 'missing'))
+    assert app.test_client().get('/').status_code == 404
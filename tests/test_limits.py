@@ -0,0 +1,99 @@
+import pytest
+
+from backend.app import create_app
+from backend.config import Config
+from backend.limits import MemoryBackend, RedisBackend, pool_queue
+from backend.models import db
+
+def test_memory_backend_caps_tracked_clients():
+    backend = MemoryBackend()
+    backend.MAX_KEYS = 1000
+    for i in range(5000):
+        assert backend.take(f'ip:{i}', rate=1, burst=5) == 0
+    assert len(backend.buckets) == 1000
+    # The most recent clients are the ones kept
+    assert 'ip:4999' in backend.buckets and 'ip:0' not in backend.buckets
+
+def test_memory_backend_refuses_empty_bucket():
+    backend = MemoryBackend()
+    assert [backend.take('ip:1', rate=0.1, burst=2) == 0 for _ in range(3)] == [True, True, False]
+    assert backend.take('ip:1', rate=0.1, burst=2) > 0
+
+def search(client, **headers):
+    return client.post('/api/search', json={'profession': 'doctor', 'lat': 1, 'lng': 2}, headers=headers)
+
+def test_search_is_rate_limited_per_client(app, client):
+    app.config['RATE_LIMIT_ENABLED'] = True
+    statuses = [search(client).status_code for _ in range(21)]
+    assert statuses[:20] == [200] * 20
+    assert statuses[20] == 429
+    assert int(search(client).headers['Retry-After']) >= 1
+
+def test_forwarded_for_ignored_without_trusted_proxy(app, client):
+    app.config['RATE_LIMIT_ENABLED'] = True
+    statuses = [search(client, **{'X-Forwarded-For': f'10.0.0.{i}'}).status_code for i in range(21)]
+    assert statuses[20] == 429
+
+def test_forwarded_for_used_behind_trusted_proxy(app):
+    class ProxyConfig(Config):
+        SQLALCHEMY_DATABASE_URI = app.config['SQLALCHEMY_DATABASE_URI']
+        PROXY_FIX_X_FOR = 1
+
+    client = create_app(ProxyConfig).test_client()
+    statuses = [search(client, **{'X-Forwarded-For': f'10.0.0.{i}'}).status_code for i in range(21)]
+    assert statuses == [200] * 21
+
+def test_pool_queue_counts_requests_beyond_exhausted_pool(app):
+    with app.app_context():
+        pool = db.engine.pool
+        capacity = pool.size() + pool._max_overflow
+        held = [db.engine.connect() for _ in range(capacity - 1)]
+        assert pool_queue(capacity + 5) == 0
+        held.append(db.engine.connect())
+        assert pool_queue(capacity + 5) == 5
+        for conn in held:
+            conn.close()
+
+def test_search_sheds_load_when_pool_queue_is_long(app, client, monkeypatch):
+    app.config['RATE_LIMIT_ENABLED'] = True
+    monkeypatch.setattr('backend.limits.pool_queue', lambda in_flight: app.config['DB_QUEUE_THRESHOLD'] + 1)
+    response = search(client)
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == str(app.config['DB_POOL_TIMEOUT'])
+
+def test_search_concurrency_cap_comes_from_config(app, client):
+    app.config['RATE_LIMIT_ENABLED'] = True
+    app.config['SEARCH_CONCURRENCY'] = 0
+    response = search(client)
+    assert response.status_code == 503
+    app.config['SEARCH_CONCURRENCY'] = 1
+    assert search(client).status_code == 200
+
+def redis_backend(monkeypatch):
+    redis = pytest.importorskip('redis')
+    fakeredis = pytest.importorskip('fakeredis')
+    pytest.importorskip('lupa')
+    server = fakeredis.FakeRedis()
+    monkeypatch.setattr(redis.Redis, 'from_url', staticmethod(lambda url: server))
+    return RedisBackend('redis://fake')
+
+def test_redis_script_refills_and_refuses(monkeypatch):
+    backend = redis_backend(monkeypatch)
+    clock = [1000.0]
+    monkeypatch.setattr('backend.limits.time.time', lambda: clock[0])
+    assert [backend.take('ip:1', rate=0.5, burst=2) for _ in range(2)] == [0, 0]
+    assert backend.take('ip:1', rate=0.5, burst=2) == pytest.approx(2.0)
+    clock[0] += 2
+    assert backend.take('ip:1', rate=0.5, burst=2) == 0
+    # Buckets are independent per key
+    assert backend.take('ip:2', rate=0.5, burst=2) == 0
+
+def test_redis_errors_fall_back_to_memory(monkeypatch):
+    backend = redis_backend(monkeypatch)
+    import redis
+
+    def unreachable(*args, **kwargs):
+        raise redis.exceptions.ConnectionError('down')
+
+    backend.script = unreachable
+    assert [backend.take('ip:1', rate=0.1, burst=1) == 0 for _ in range(2)] == [True, False]
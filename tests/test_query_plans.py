@@ -0,0 +1,43 @@
+"""
+The hot queries must be served by the indexes from the hot-path migration.
+"""
+from sqlalchemy import event
+
+from backend.Database import find_matching_professionals
+from backend.models import db
+
+def captured_selects(app, run):
+    """Run a callable inside the app and return the SELECT statements it executed"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append((statement, parameters))
+
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', capture)
+        try:
+            run()
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', capture)
+    return statements
+
+def query_plan(app, statement, parameters):
+    with app.app_context():
+        with db.engine.connect() as conn:
+            rows = conn.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).fetchall()
+    return ' | '.join(row[-1] for row in rows)
+
+def test_search_uses_profession_index(app, client):
+    statements = captured_selects(
+        app, lambda: client.post('/api/search', json={'profession': 'doctor', 'lat': 1, 'lng': 2})
+    )
+    assert statements
+    plans = [query_plan(app, *s) for s in statements]
+    assert any('ix_professional_profession_lat_lng' in plan for plan in plans), plans
+
+def test_match_uses_profile_flags_index(app):
+    statements = captured_selects(app, lambda: find_matching_professionals(['doctor']))
+    assert statements
+    plans = [query_plan(app, *s) for s in statements]
+    assert any('ix_profile_is_available_is_advertiser' in plan for plan in plans), plans